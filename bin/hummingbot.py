@@ -24,6 +24,14 @@ from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
 
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    # uvloop is optional; the default asyncio event loop is used when it is not available
+    pass
+
 
 class UIStartListener(EventListener):
     def __init__(self, hummingbot_app: HummingbotApplication, is_script: Optional[bool] = False, is_quickstart: Optional[bool] = False):
@@ -18,6 +18,8 @@ class BinancePerpetualAuth(AuthBase):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._time_provider: TimeSynchronizer = time_provider
+        # The API key never changes after construction, so the auth header is built only once
+        self._auth_headers: Dict[str, str] = {"X-MBX-APIKEY": self._api_key}
 
     def generate_signature_from_payload(self, payload: str) -> str:
         secret = bytes(self._api_secret.encode("utf-8"))
@@ -30,7 +32,7 @@ class BinancePerpetualAuth(AuthBase):
         else:
             request.params = self.add_auth_to_params(request.params)
 
-        request.headers = {"X-MBX-APIKEY": self._api_key}
+        request.headers = self._auth_headers
 
         return request
 
@@ -32,6 +32,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
 
         super().__init__()
         self._domain = domain
+        self._ws_base_url = web_utils.wss_url(CONSTANTS.PRIVATE_WS_ENDPOINT, domain)
         self._api_factory = api_factory
         self._auth = auth
         self._ws_assistants: List[WSAssistant] = []
@@ -119,11 +120,12 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         """
         Creates an instance of WSAssistant connected to the exchange
         """
-        self._manage_listen_key_task = safe_ensure_future(self._manage_listen_key_task_loop())
+        if self._manage_listen_key_task is None or self._manage_listen_key_task.done():
+            self._manage_listen_key_task = safe_ensure_future(self._manage_listen_key_task_loop())
         await self._listen_key_initialized_event.wait()
 
         ws: WSAssistant = await self._get_ws_assistant()
-        url = f"{web_utils.wss_url(CONSTANTS.PRIVATE_WS_ENDPOINT, self._domain)}/{self._current_listen_key}"
+        url = f"{self._ws_base_url}/{self._current_listen_key}"
         await ws.connect(ws_url=url, ping_timeout=self.HEARTBEAT_TIME_INTERVAL)
         return ws
 
@@ -140,6 +142,7 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
     async def _on_user_stream_interruption(self, websocket_assistant: Optional[WSAssistant]):
         websocket_assistant and await websocket_assistant.disconnect()
         self._manage_listen_key_task and self._manage_listen_key_task.cancel()
+        self._manage_listen_key_task = None
         self._current_listen_key = None
         self._listen_key_initialized_event.clear()
         await self._sleep(5)
@@ -9,9 +9,11 @@ from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 CENTRALIZED = True
 EXAMPLE_PAIR = "ZRX-ETH"
 
+_DEFAULT_FEE = Decimal("0.001")
+
 DEFAULT_FEES = TradeFeeSchema(
-    maker_percent_fee_decimal=Decimal("0.001"),
-    taker_percent_fee_decimal=Decimal("0.001"),
+    maker_percent_fee_decimal=_DEFAULT_FEE,
+    taker_percent_fee_decimal=_DEFAULT_FEE,
     buy_percent_fee_deducted_from_returns=True
 )
 
@@ -22,7 +24,8 @@ def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     :param exchange_info: the exchange information for a trading pair
     :return: True if the trading pair is enabled, False otherwise
     """
-    return exchange_info.get("status", None) == "TRADING" and "SPOT" in exchange_info.get("permissions", list())
+    permissions = exchange_info.get("permissions")
+    return exchange_info.get("status") == "TRADING" and permissions is not None and "SPOT" in permissions
 
 
 class UpbitConfigMap(BaseConnectorConfigMap):
@@ -58,8 +61,9 @@ OTHER_DOMAINS_EXAMPLE_PAIR = {"upbit": "BTC-USDT"}
 OTHER_DOMAINS_DEFAULT_FEES = {"upbit": DEFAULT_FEES}
 
 
-class UpbitUSConfigMap(BaseConnectorConfigMap):
-    connector: str = Field(default="upbit", const=True, client_data=None)
+# The US variant only differs from `UpbitConfigMap` in the API key prompt, so it inherits the rest
+# of the field definitions instead of compiling a second identical pydantic model at import time
+class UpbitUSConfigMap(UpbitConfigMap):
     upbit_api_key: SecretStr = Field(
         default=...,
         client_data=ClientFieldData(
@@ -69,18 +73,7 @@ class UpbitUSConfigMap(BaseConnectorConfigMap):
             prompt_on_new=True,
         )
     )
-    upbit_api_secret: SecretStr = Field(
-        default=...,
-        client_data=ClientFieldData(
-            prompt=lambda cm: "Enter your Upbit API secret",
-            is_secure=True,
-            is_connect_key=True,
-            prompt_on_new=True,
-        )
-    )
-
-    class Config:
-        title = "upbit"
 
 
-OTHER_DOMAINS_KEYS = {"Upbit": UpbitConfigMap.construct()}
+# Reuse the singleton built above instead of walking the pydantic fields a second time at import
+OTHER_DOMAINS_KEYS = {"Upbit": KEYS}
@@ -74,9 +74,10 @@ class UserStreamTrackerDataSource(metaclass=ABCMeta):
         raise NotImplementedError
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant, queue: asyncio.Queue):
+        # The event processor is bound once outside the loop to avoid a method lookup per received frame
+        process_event_message = self._process_event_message
         async for ws_response in websocket_assistant.iter_messages():
-            data = ws_response.data
-            await self._process_event_message(event_message=data, queue=queue)
+            await process_event_message(event_message=ws_response.data, queue=queue)
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0:
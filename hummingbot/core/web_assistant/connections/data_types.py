@@ -6,6 +6,11 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from ujson import loads as json_loads
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -111,7 +116,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=json_loads)
         return json_
 
     async def text(self) -> str:
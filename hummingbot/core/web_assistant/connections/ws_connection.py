@@ -1,11 +1,10 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
-from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse, json_loads
 
 
 class WSConnection:
@@ -128,8 +127,8 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=json_loads)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
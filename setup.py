@@ -75,6 +75,7 @@ def main():
         "nose",
         "nose-exclude",
         "numpy",
+        "orjson",
         "pandas",
         "pip",
         "pre-commit",
@@ -96,6 +97,7 @@ def main():
         "tabulate",
         "tzlocal",
         "ujson",
+        "uvloop; platform_system != 'Windows'",
         "web3",
         "websockets",
         "yarl",